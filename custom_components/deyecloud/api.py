@@ -1,22 +1,192 @@
+import asyncio
 import hashlib
+import json
+import logging
+import time
+
 import aiohttp
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .const import (
+    DOMAIN,
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    CONF_APP_ID,
+    CONF_APP_SECRET,
+    CONF_BASE_URL,
+)
+
+# DeyeCloud tokens stay valid for roughly an hour; refresh well before that.
+TOKEN_TTL = 30 * 60
+# Refresh slightly early so a token never expires mid-request
+TOKEN_EXPIRY_MARGIN = 60
+
+# Fail fast on connection stalls while tolerating slow reads
+_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5, sock_read=10)
+
+# C-implemented JSON parser when available; history payloads can be large
+_JSON_LOADS = orjson.loads if orjson is not None else json.loads
+
+_LOGGER = logging.getLogger(__name__)
+
+# Pre-bound constructor skips the hashlib attribute lookup per call
+_HASHER = hashlib.sha256
+
+# Bounded retries for transient failures; backoff is 0.25s, 0.5s
+_MAX_ATTEMPTS = 3
+
+async def async_post_json(session: aiohttp.ClientSession, url, payload, headers=None):
+    """POST a JSON payload and decode the JSON response.
+
+    Retries transient failures (connection errors, timeouts, 5xx) a couple
+    of times with exponential backoff, and honors HTTP 429 by sleeping for
+    the advertised Retry-After (capped), so a momentary blip doesn't abort
+    an entire update cycle.
+    """
+    for attempt in range(_MAX_ATTEMPTS):
+        last = attempt == _MAX_ATTEMPTS - 1
+        try:
+            async with session.post(url, json=payload, headers=headers, timeout=_TIMEOUT) as resp:
+                if resp.status == 429 and not last:
+                    retry_after = resp.headers.get("Retry-After")
+                    try:
+                        delay = min(float(retry_after), 30.0) if retry_after else 1.0
+                    except ValueError:
+                        delay = 1.0
+                    _LOGGER.warning("Rate limited by DeyeCloud, retrying in %.1fs", delay)
+                    await asyncio.sleep(delay)
+                    continue
+                if resp.status >= 500 and not last:
+                    _LOGGER.warning("DeyeCloud returned %d for %s, retrying", resp.status, url)
+                    await asyncio.sleep(0.25 * 2 ** attempt)
+                    continue
+                resp.raise_for_status()
+                return await resp.json(loads=_JSON_LOADS)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+            if last:
+                raise
+            _LOGGER.warning("Transient error talking to DeyeCloud (%s), retrying", exc)
+            await asyncio.sleep(0.25 * 2 ** attempt)
+
 def _sha256(password: str) -> str:
-    return hashlib.sha256(password.encode("utf-8")).hexdigest().lower()
+    return _HASHER(password.encode("utf-8")).hexdigest().lower()
 
 async def async_get_token(session: aiohttp.ClientSession, username, password, app_id, app_secret, base_url):
+    return await async_get_token_prehashed(
+        session, username, _sha256(password), app_id, app_secret, base_url
+    )
+
+async def async_get_token_prehashed(session: aiohttp.ClientSession, username, password_sha256, app_id, app_secret, base_url):
+    """Request a token with an already SHA-256-hashed password."""
     url = f"{base_url}/account/token?appId={app_id}"
     payload = {
         "appSecret": app_secret,
         "username": username,
-        "password": _sha256(password),
+        "password": password_sha256,
     }
-    async with session.post(url, json=payload, timeout=10) as resp:
-        resp.raise_for_status()
-        j = await resp.json()
+    j = await async_post_json(session, url, payload)
+    if not j.get("success"):
+        raise Exception(f"Token request failed: {j.get('msg')}")
+    return j["accessToken"]
+
+async def async_get_cached_token(hass, session: aiohttp.ClientSession, entry, force_refresh=False):
+    """Return a cached token for this entry, refreshing it only when expired.
+
+    The token and its expiry are kept in hass.data[DOMAIN][entry.entry_id] so
+    sensor polls and button presses share a single authentication round-trip.
+    Concurrent callers are coalesced behind a per-entry lock.
+    """
+    store = hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {})
+    lock = store.setdefault("token_lock", asyncio.Lock())
+    async with lock:
+        if (
+            not force_refresh
+            and store.get("token")
+            and store.get("token_expires_at", 0) - TOKEN_EXPIRY_MARGIN > time.monotonic()
+        ):
+            return store["token"]
+        # Hash the password once per entry; every later refresh reuses the digest
+        pw_hash = store.get("pw_hash")
+        if pw_hash is None:
+            pw_hash = store["pw_hash"] = _sha256(entry.data[CONF_PASSWORD])
+        token = await async_get_token_prehashed(
+            session,
+            entry.data[CONF_USERNAME],
+            pw_hash,
+            entry.data[CONF_APP_ID],
+            entry.data[CONF_APP_SECRET],
+            entry.data[CONF_BASE_URL],
+        )
+        store["token"] = token
+        store["token_expires_at"] = time.monotonic() + TOKEN_TTL
+        return token
+
+def invalidate_cached_token(hass, entry):
+    """Drop the cached token so the next caller re-authenticates."""
+    store = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if store:
+        store.pop("token", None)
+        store.pop("token_expires_at", None)
+
+# Stations and devices rarely change; cache them briefly so sensor and button
+# setup don't each re-fetch the same lists.
+TOPOLOGY_TTL = 5 * 60
+
+DEVICE_PAGE_SIZE = 50
+
+async def async_list_devices(session: aiohttp.ClientSession, token, base_url, station_ids, headers=None):
+    """Fetch every device for the given stations, following pagination."""
+    url = f"{base_url}/station/device"
+    if headers is None:
+        headers = {"Authorization": f"Bearer {token}"}
+    devices = []
+    page = 1
+    while True:
+        payload = {"page": page, "size": DEVICE_PAGE_SIZE, "stationIds": station_ids}
+        j = await async_post_json(session, url, payload, headers=headers)
         if not j.get("success"):
-            raise Exception(f"Token request failed: {j.get('msg')}")
-        return j["accessToken"]
+            raise Exception(f"Device list request failed: {j.get('msg')}")
+        items = j.get("deviceListItems", [])
+        devices.extend(items)
+        # A short page means we've seen the last one
+        if len(items) < DEVICE_PAGE_SIZE:
+            return devices
+        page += 1
+
+async def async_get_stations_and_devices(session: aiohttp.ClientSession, token, base_url):
+    """Fetch the station list and the devices belonging to those stations."""
+    headers = {"Authorization": f"Bearer {token}"}
+
+    url = f"{base_url}/station/list"
+    j = await async_post_json(session, url, {}, headers=headers)
+    stations = j.get("stationList", [])
+
+    devices = []
+    station_ids = [st.get("id") or st.get("stationId") for st in stations if st.get("id") or st.get("stationId")]
+    if station_ids:
+        devices = await async_list_devices(session, token, base_url, station_ids)
+
+    return stations, devices
+
+async def async_get_cached_topology(hass, session: aiohttp.ClientSession, entry, token):
+    """Return (stations, devices) for this entry, cached for TOPOLOGY_TTL seconds."""
+    store = hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {})
+    topology = store.get("topology")
+    if topology and topology["expires_at"] > time.monotonic():
+        return topology["stations"], topology["devices"]
+    stations, devices = await async_get_stations_and_devices(
+        session, token, entry.data[CONF_BASE_URL]
+    )
+    store["topology"] = {
+        "stations": stations,
+        "devices": devices,
+        "expires_at": time.monotonic() + TOPOLOGY_TTL,
+    }
+    return stations, devices
 
 async def async_control_solar_sell(session: aiohttp.ClientSession, token, base_url, device_sn, is_enable):
     """Send Solar Sell control command."""
@@ -34,6 +204,4 @@ async def async_control_solar_sell(session: aiohttp.ClientSession, token, base_u
         "deviceSn": device_sn
     }
     
-    async with session.post(url, json=payload, headers=headers, timeout=10) as resp:
-        resp.raise_for_status()
-        return await resp.json()
\ No newline at end of file
+    return await async_post_json(session, url, payload, headers=headers)
\ No newline at end of file
@@ -1,7 +1,7 @@
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
-import aiohttp
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .const import DOMAIN, CONF_USERNAME, CONF_PASSWORD, CONF_APP_ID, CONF_APP_SECRET, CONF_BASE_URL, CONF_START_MONTH    
 from .api import async_get_token
 
@@ -21,15 +21,15 @@ class DeyeCloudConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
         if user_input is not None:
             try:
-                async with aiohttp.ClientSession() as session:
-                    await async_get_token(
-                        session,
-                        user_input[CONF_USERNAME],
-                        user_input[CONF_PASSWORD],
-                        user_input[CONF_APP_ID],
-                        user_input[CONF_APP_SECRET],
-                        user_input[CONF_BASE_URL]
-                    )
+                session = async_get_clientsession(self.hass)
+                await async_get_token(
+                    session,
+                    user_input[CONF_USERNAME],
+                    user_input[CONF_PASSWORD],
+                    user_input[CONF_APP_ID],
+                    user_input[CONF_APP_SECRET],
+                    user_input[CONF_BASE_URL]
+                )
                 return self.async_create_entry(
                     title=f"DeyeCloud - {user_input[CONF_USERNAME]}",
                     data=user_input
@@ -48,15 +48,15 @@ class DeyeCloudConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
         if user_input is not None:
             try:
-                async with aiohttp.ClientSession() as session:
-                    await async_get_token(
-                        session,
-                        user_input[CONF_USERNAME],
-                        user_input[CONF_PASSWORD],
-                        user_input[CONF_APP_ID],
-                        user_input[CONF_APP_SECRET],
-                        user_input[CONF_BASE_URL]
-                    )
+                session = async_get_clientsession(self.hass)
+                await async_get_token(
+                    session,
+                    user_input[CONF_USERNAME],
+                    user_input[CONF_PASSWORD],
+                    user_input[CONF_APP_ID],
+                    user_input[CONF_APP_SECRET],
+                    user_input[CONF_BASE_URL]
+                )
                 # Update the entry data with new options
                 self.hass.config_entries.async_update_entry(
                     self.config_entry,
@@ -1,16 +1,28 @@
 import logging
-from datetime import timedelta, datetime, date
-from dateutil.relativedelta import relativedelta
+from datetime import timedelta, date
+from operator import itemgetter
 import hashlib
 import json
 import os
+import time
 import aiohttp
 import aiofiles
 import asyncio
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from homeassistant.util import dt as dt_util
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.update_coordinator import (
@@ -19,12 +31,14 @@ from homeassistant.helpers.update_coordinator import (
     UpdateFailed,
 )
 
+from .api import (
+    async_get_cached_token,
+    async_get_cached_topology,
+    async_post_json,
+    invalidate_cached_token,
+)
 from .const import (
     DOMAIN,
-    CONF_USERNAME,
-    CONF_PASSWORD,
-    CONF_APP_ID,
-    CONF_APP_SECRET,
     CONF_BASE_URL,
     CONF_START_MONTH,
 )
@@ -32,6 +46,15 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 SCAN_INTERVAL = timedelta(minutes=1)
 HISTORY_START_MONTH = "2024-01"
+# Per-entry cache file; two entries must never rewrite each other's stations
+HISTORY_CACHE_FILE = "deye_history_{}.json"
+# Pre-per-entry shared cache, read once as a migration fallback
+_LEGACY_CACHE_FILE = "deye_history.json"
+# Monthly totals move slowly; refetch them far less often than device data
+HISTORY_REFRESH_INTERVAL = timedelta(minutes=15)
+
+# C-implemented JSON parser when available; history payloads can be large
+_JSON_LOADS = orjson.loads if orjson is not None else json.loads
 
 _RELATIVE_DAY_OFFSETS = {
     "today": 0,
@@ -39,6 +62,109 @@ _RELATIVE_DAY_OFFSETS = {
     "day_before": 2,
 }
 
+# 1-based month abbreviations; cheaper than datetime(...).strftime("%b %Y") per record
+_MONTH_ABBR = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Only these record keys are consumed by sensors; history records are
+# projected down to them at ingestion so the coordinator snapshot and the
+# on-disk cache don't carry whatever else the API returns
+_HISTORY_KEYS = (
+    "year",
+    "month",
+    "generationValue",
+    "consumptionValue",
+    "gridValue",
+    "purchaseValue",
+    "chargeValue",
+    "dischargeValue",
+)
+
+_MONTHLY_METRICS = [
+    ("generationValue", "Solar Generation"),
+    ("consumptionValue", "Monthly Consumption"),
+    ("gridValue", "Monthly Grid Export"),
+    ("purchaseValue", "Monthly Grid Import"),
+    ("chargeValue", "Monthly Battery Charge"),
+    ("dischargeValue", "Monthly Battery Discharge"),
+]
+
+# (relative key, unique_id suffix, display label) for the daily sensor set
+_RELATIVE_DAY_SENSORS = [
+    ("day_before", "_day_before", " day before"),
+    ("yesterday", "_yesterday", " yesterday"),
+    ("today", "_today", " today"),
+]
+
+_DAILY_METRICS = [
+    ("generationValue", "Solar Generation"),
+    ("consumptionValue", "Daily Consumption"),
+    ("gridValue", "Daily Grid Export"),
+    ("purchaseValue", "Daily Grid Import"),
+    ("chargeValue", "Daily Battery Charge"),
+    ("dischargeValue", "Daily Battery Discharge"),
+]
+
+# Shared, immutable entity descriptions: one instance per unit instead of
+# re-binding unit/device_class/state_class attributes on every entity
+_ENERGY_DESCRIPTION = SensorEntityDescription(
+    key="energy_kwh",
+    native_unit_of_measurement="kWh",
+    device_class=SensorDeviceClass.ENERGY,
+    state_class=SensorStateClass.TOTAL_INCREASING,
+)
+
+_UNIT_DESCRIPTIONS = {
+    "kWh": _ENERGY_DESCRIPTION,
+    "W": SensorEntityDescription(
+        key="power_w",
+        native_unit_of_measurement="W",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "V": SensorEntityDescription(
+        key="voltage_v",
+        native_unit_of_measurement="V",
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "A": SensorEntityDescription(
+        key="current_a",
+        native_unit_of_measurement="A",
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "%": SensorEntityDescription(
+        key="battery_pct",
+        native_unit_of_measurement="%",
+        device_class=SensorDeviceClass.BATTERY,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "C": SensorEntityDescription(
+        key="temperature_c",
+        native_unit_of_measurement="C",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "°C": SensorEntityDescription(
+        key="temperature_c_deg",
+        native_unit_of_measurement="°C",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "Hz": SensorEntityDescription(
+        key="frequency_hz",
+        native_unit_of_measurement="Hz",
+        device_class=SensorDeviceClass.FREQUENCY,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+}
+
+
+def _prev_ym(ym: tuple[int, int]) -> tuple[int, int]:
+    """Return the (year, month) preceding the given one."""
+    year, month = ym
+    return (year, month - 1) if month > 1 else (year - 1, 12)
+
 
 def _resolve_daily_date_key(date_key: str) -> str:
     """Convert relative day key (today/yesterday/...) to YYYY-MM-DD using HA timezone."""
@@ -48,85 +174,120 @@ def _resolve_daily_date_key(date_key: str) -> str:
     return date_key  # already YYYY-MM-DD
 
 
-def _sha256(password: str) -> str:
-    return hashlib.sha256(password.encode("utf-8")).hexdigest().lower()
-
-
-async def _async_get_token(session: aiohttp.ClientSession, username, password, app_id, app_secret, base_url):
-    url = f"{base_url}/account/token?appId={app_id}"
-    _LOGGER.debug("Requesting token from API: %s", url)
-    payload = {
-        "appSecret": app_secret,
-        "username": username,
-        "password": _sha256(password),
-    }
-    async with session.post(url, json=payload, timeout=10) as resp:
-        resp.raise_for_status()
-        j = await resp.json()
-        if not j.get("success"):
-            _LOGGER.error("Token request failed: %s", j.get("msg"))
-            raise Exception(f"Token request failed: {j.get('msg')}")
-        _LOGGER.debug("Token request successful")
-        return j["accessToken"]
-
-
-async def _async_station_list(session, token, base_url):
-    url = f"{base_url}/station/list"
-    _LOGGER.debug("Fetching station list from API: %s", url)
-    headers = {"Authorization": f"Bearer {token}"}
-    async with session.post(url, headers=headers, json={}, timeout=10) as resp:
-        resp.raise_for_status()
-        stations = (await resp.json()).get("stationList", [])
-        _LOGGER.info("Received %d stations from API", len(stations))
-        return stations
-
-
-async def _async_history(session, token, station_id, base_url):
-    """Fetch monthly history from HISTORY_START_MONTH to current month (HA local date)."""
+# Cap in-flight history requests so concurrent windows don't hammer the API
+_HISTORY_SEMAPHORE = asyncio.Semaphore(8)
+
+# Cap how many stations are processed at once; accounts with dozens of
+# stations would otherwise fan out a thundering herd each cycle
+_STATION_SEMAPHORE = asyncio.Semaphore(4)
+
+
+async def _async_load_history_cache(hass, entry):
+    """Load this entry's persisted monthly history cache ({station_id: [items]})."""
+    path = hass.config.path(HISTORY_CACHE_FILE.format(entry.entry_id))
+    # Stat off-loop; a blocking syscall here can stall HA on slow storage
+    if not await hass.async_add_executor_job(os.path.exists, path):
+        # Fall back to the old shared file once; the next save writes per-entry
+        path = hass.config.path(_LEGACY_CACHE_FILE)
+        if not await hass.async_add_executor_job(os.path.exists, path):
+            return {}
+    try:
+        async with aiofiles.open(path, "rb") as f:
+            cache = _JSON_LOADS(await f.read())
+        _LOGGER.debug("Loaded history cache for %d stations from %s", len(cache), path)
+        return cache
+    except (OSError, ValueError) as exc:
+        _LOGGER.warning("Could not load history cache %s: %s", path, exc)
+        return {}
+
+
+async def _async_save_history_cache(hass, entry, cache):
+    """Persist this entry's monthly history cache so restarts only fetch new months."""
+    path = hass.config.path(HISTORY_CACHE_FILE.format(entry.entry_id))
+    # Machine cache: serialize compact (orjson when available) rather than pretty-printed
+    if orjson is not None:
+        payload = orjson.dumps(cache)
+    else:
+        payload = json.dumps(cache, separators=(",", ":")).encode("utf-8")
+
+    # Skip the disk write entirely when nothing changed since the last save;
+    # the digest lives in the entry's bucket alongside its token cache
+    store = hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {})
+    digest = hashlib.sha256(payload).digest()
+    if store.get("history_cache_digest") == digest:
+        return
+
+    # Write to a temp file and rename so a crash never leaves a torn cache
+    tmp_path = f"{path}.tmp"
+    try:
+        async with aiofiles.open(tmp_path, "wb") as f:
+            await f.write(payload)
+        await hass.async_add_executor_job(os.replace, tmp_path, path)
+    except OSError as exc:
+        _LOGGER.warning("Could not save history cache %s: %s", path, exc)
+        return
+    store["history_cache_digest"] = digest
+
+
+async def _async_history(session, headers, station_id, base_url, start: date):
+    """Yield monthly history records from start (first of month) to current month (HA local date).
+
+    Async generator so the caller can merge/index records in a single pass
+    without materializing an intermediate flattened list.
+    """
     url = f"{base_url}/station/history"
-    headers = {"Authorization": f"Bearer {token}"}
-    items: list[dict] = []
 
     # Use date objects to avoid naive/aware datetime issues
-    start_dt = datetime.strptime(HISTORY_START_MONTH, "%Y-%m")
-    start: date = start_dt.date().replace(day=1)
     end: date = dt_util.now().date().replace(day=1)
 
+    # Work in absolute month indexes (year*12 + month-1): plain integer
+    # arithmetic instead of relativedelta for the window stepping
+    def _ym(idx: int) -> str:
+        return f"{idx // 12}-{idx % 12 + 1:02d}"
+
+    start_idx = start.year * 12 + start.month - 1
+    end_idx = end.year * 12 + end.month - 1
+
     _LOGGER.debug(
         "Fetching monthly history for station_id %s from %s to %s",
         station_id,
-        start.strftime("%Y-%m"),
-        end.strftime("%Y-%m"),
+        _ym(start_idx),
+        _ym(end_idx),
     )
 
-    while start <= end:
-        range_start: date = start
-        range_end: date = min(range_start + relativedelta(months=11), end)
+    # Precompute all 12-month windows, then fetch them concurrently
+    windows: list[tuple[str, str]] = []
+    while start_idx <= end_idx:
+        range_end_idx = min(start_idx + 11, end_idx)
+        windows.append((_ym(start_idx), _ym(range_end_idx)))
+        start_idx = range_end_idx + 1
 
+    async def _fetch_window(range_start: str, range_end: str) -> list[dict]:
         payload = {
             "stationId": station_id,
             "granularity": 3,
-            "startAt": range_start.strftime("%Y-%m"),
-            "endAt": range_end.strftime("%Y-%m"),
+            "startAt": range_start,
+            "endAt": range_end,
         }
+        async with _HISTORY_SEMAPHORE:
+            j = await async_post_json(session, url, payload, headers=headers)
+        if not j.get("success"):
+            _LOGGER.error("Monthly history request failed for station_id %s: %s", station_id, j.get("msg"))
+            raise Exception(f"History request failed: {j.get('msg')}")
+        return j.get("stationDataItems", [])
 
-        async with session.post(url, headers=headers, json=payload, timeout=10) as resp:
-            resp.raise_for_status()
-            j = await resp.json()
-            if not j.get("success"):
-                _LOGGER.error("Monthly history request failed for station_id %s: %s", station_id, j.get("msg"))
-                raise Exception(f"History request failed: {j.get('msg')}")
-            items.extend(j.get("stationDataItems", []))
-
-        start = range_end + relativedelta(months=1)
+    results = await asyncio.gather(*(_fetch_window(rs, re) for rs, re in windows))
+    count = 0
+    for window_items in results:
+        count += len(window_items)
+        for item in window_items:
+            yield {k: item.get(k) for k in _HISTORY_KEYS}
 
-    _LOGGER.debug("Received %d monthly records for station_id %s", len(items), station_id)
-    return items
+    _LOGGER.debug("Received %d monthly records for station_id %s", count, station_id)
 
 
-async def _async_daily_history(session, token, station_id, base_url, start_date, end_date):
+async def _async_daily_history(session, headers, station_id, base_url, start_date, end_date):
     url = f"{base_url}/station/history"
-    headers = {"Authorization": f"Bearer {token}"}
     payload = {
         "stationId": station_id,
         "granularity": 2,
@@ -134,54 +295,27 @@ async def _async_daily_history(session, token, station_id, base_url, start_date,
         "endAt": end_date,
     }
     _LOGGER.debug("Fetching daily data for station_id %s from %s to %s", station_id, start_date, end_date)
-    async with session.post(url, headers=headers, json=payload, timeout=10) as resp:
-        resp.raise_for_status()
-        j = await resp.json()
-        if not j.get("success"):
-            _LOGGER.error("Daily history request failed for station_id %s: %s", station_id, j.get("msg"))
-            raise Exception(f"Daily history request failed: {j.get('msg')}")
-        items = j.get("stationDataItems", [])
-        _LOGGER.debug("Received %d daily records for station_id %s", len(items), station_id)
-        return items
-
-
-async def _async_get_device_list(session, token, base_url, stations):
-    url = f"{base_url}/station/device"
-    _LOGGER.debug("Fetching device list from API: %s", url)
-    headers = {"Authorization": f"Bearer {token}"}
-    station_ids = [st.get("id") or st.get("stationId") for st in stations if st.get("id") or st.get("stationId")]
-    if not station_ids:
-        _LOGGER.warning("No stationIds available for request")
-        return []
-    payload = {
-        "page": 1,
-        "size": 20,
-        "stationIds": station_ids
-    }
-    _LOGGER.debug("Sending payload: %s", payload)
-    async with session.post(url, headers=headers, json=payload, timeout=10) as resp:
-        resp.raise_for_status()
-        j = await resp.json()
-        if not j.get("success"):
-            _LOGGER.error("Device list request failed: %s", j.get("msg"))
-            raise Exception(f"Device list request failed: {j.get('msg')}")
-        _LOGGER.debug("Received device list: %s", j)
-        return [item["deviceSn"] for item in j.get("deviceListItems", []) if item.get("deviceType") == "INVERTER"]
+    j = await async_post_json(session, url, payload, headers=headers)
+    if not j.get("success"):
+        _LOGGER.error("Daily history request failed for station_id %s: %s", station_id, j.get("msg"))
+        raise Exception(f"Daily history request failed: {j.get('msg')}")
+    items = j.get("stationDataItems", [])
+    _LOGGER.debug("Received %d daily records for station_id %s", len(items), station_id)
+    return items
 
 
-async def _async_get_device_status(session, token, base_url, device_list):
+async def _async_get_device_status(session, headers, base_url, device_list):
     url = f"{base_url}/device/latest"
-    _LOGGER.debug("Fetching device status from API: %s with devices: %s", url, device_list)
-    headers = {"Authorization": f"Bearer {token}"}
+    _LOGGER.debug("Fetching device status from API: %s for %d devices", url, len(device_list))
     payload = {"deviceList": device_list}
-    async with session.post(url, headers=headers, json=payload, timeout=10) as resp:
-        resp.raise_for_status()
-        j = await resp.json()
-        if not j.get("success"):
-            _LOGGER.error("Device status request failed: %s", j.get("msg"))
-            raise Exception(f"Device status request failed: {j.get('msg')}")
-        _LOGGER.debug("Received device status: %s", j)
-        return j.get("deviceDataList", [])
+    j = await async_post_json(session, url, payload, headers=headers)
+    if not j.get("success"):
+        _LOGGER.error("Device status request failed: %s", j.get("msg"))
+        raise Exception(f"Device status request failed: {j.get('msg')}")
+    items = j.get("deviceDataList", [])
+    # Log a count, not the payload: repr of a full status response is large
+    _LOGGER.debug("Received status for %d devices", len(items))
+    return items
 
 
 class DeyeCloudCoordinator(DataUpdateCoordinator):
@@ -196,100 +330,208 @@ class DeyeCloudCoordinator(DataUpdateCoordinator):
         )
         self.entry = entry
         self.token = None
-        self.token_expiry = None
+        self._headers = None  # Authorization header, rebuilt when the token changes
         self.data = {}  # Structure: {station_id: {info, history, daily, devices}}
+        self._history_cache = None  # {station_id(str): [items]}, loaded on first refresh
+        self._history_next_refresh = {}  # station_id -> monotonic deadline
+        # Parsed once here; multiple entries with different start months stay independent.
+        # fromisoformat avoids strptime's format-string interpreter.
+        self._history_start = date.fromisoformat(
+            entry.data.get(CONF_START_MONTH, HISTORY_START_MONTH) + "-01"
+        )
+        # (year, month) snapshots taken once per refresh; sensor reads use
+        # these instead of calling dt_util.now() per state access
+        now = dt_util.now()
+        self.current_ym = (now.year, now.month)
+        self.last_ym = _prev_ym(self.current_ym)
 
     async def _async_update_data(self) -> dict:
         """Fetch data from API."""
-        username = self.entry.data[CONF_USERNAME]
-        password = self.entry.data[CONF_PASSWORD]
-        app_id = self.entry.data[CONF_APP_ID]
-        app_secret = self.entry.data[CONF_APP_SECRET]
         base_url = self.entry.data[CONF_BASE_URL]
 
-        async with aiohttp.ClientSession() as session:
-            # Get/Refresh token (use UTC-aware)
-            now_utc = dt_util.utcnow()
-            if not self.token or (self.token_expiry and self.token_expiry < now_utc):
-                try:
-                    self.token = await _async_get_token(
-                        session, username, password, app_id, app_secret, base_url
-                    )
-                    self.token_expiry = dt_util.utcnow() + timedelta(minutes=30)  # Token valid for 30 mins
-                    _LOGGER.debug("Token refreshed, valid until %s", self.token_expiry)
-                except Exception as exc:
-                    raise UpdateFailed(f"Token refresh failed: {exc}") from exc
-
-            # Fetch stations
+        if self._history_cache is None:
+            self._history_cache = await _async_load_history_cache(self.hass, self.entry)
+
+        # Refresh the month snapshots; all sensors reading this cycle's data
+        # then agree on what "current" and "last" month mean
+        now = dt_util.now()
+        self.current_ym = (now.year, now.month)
+        self.last_ym = _prev_ym(self.current_ym)
+
+        # HA's shared pooled session: keep-alive connections persist between cycles
+        session = async_get_clientsession(self.hass)
+
+        # Get/Refresh token (cached per entry, shared with button presses)
+        try:
+            self.token = await async_get_cached_token(self.hass, session, self.entry)
+        except Exception as exc:
+            raise UpdateFailed(f"Token refresh failed: {exc}") from exc
+        # Built once per cycle; every helper below reuses the same dict
+        self._headers = {"Authorization": f"Bearer {self.token}"}
+
+        # Fetch stations (topology is cached for a few minutes, shared with button setup)
+        try:
             try:
-                stations = await _async_station_list(session, self.token, base_url)
-                if not stations:
-                    raise UpdateFailed("No stations found")
-            except Exception as exc:
-                raise UpdateFailed(f"Error fetching stations: {exc}") from exc
-
-            # Fetch data for each station concurrently
-            station_data = {}
-            station_tasks = []
-            for station in stations:
-                station_id = station.get("id") or station.get("stationId")
-                if station_id:
-                    station_tasks.append(self._async_update_station_data(session, station_id, base_url, station))
-
-            results = await asyncio.gather(*station_tasks, return_exceptions=True)
-            for result in results:
-                if isinstance(result, Exception):
-                    _LOGGER.error("Error updating station data: %s", result)
-                elif result:
-                    station_id, data = result
-                    station_data[station_id] = data
-
-            return station_data
-
-    async def _async_update_station_data(self, session, station_id, base_url, station_info):
-        """Fetch data for a single station."""
-        data = {"info": station_info, "history": [], "daily": {}, "devices": {}}
+                stations, devices = await async_get_cached_topology(
+                    self.hass, session, self.entry, self.token
+                )
+            except aiohttp.ClientResponseError as err:
+                if err.status != 401:
+                    raise
+                # Token rejected before its local expiry: refresh and retry once
+                self.token = await async_get_cached_token(
+                    self.hass, session, self.entry, force_refresh=True
+                )
+                self._headers = {"Authorization": f"Bearer {self.token}"}
+                stations, devices = await async_get_cached_topology(
+                    self.hass, session, self.entry, self.token
+                )
+            if not stations:
+                raise UpdateFailed("No stations found")
+        except Exception as exc:
+            raise UpdateFailed(f"Error fetching stations: {exc}") from exc
 
+        # Device membership comes from the cached topology, so the device
+        # list is fetched at most once per TOPOLOGY_TTL; only the status
+        # call below needs per-cycle freshness
+        devices_by_station = {}
         try:
-            # Fetch monthly history
-            data["history"] = await _async_history(session, self.token, station_id, base_url)
+            station_ids = [s.get("id") or s.get("stationId") for s in stations if s.get("id") or s.get("stationId")]
+            sn_to_station = {
+                item["deviceSn"]: item.get("stationId")
+                for item in devices
+                if item.get("deviceType") == "INVERTER" and item.get("deviceSn")
+            }
+            if sn_to_station:
+                device_status = await _async_get_device_status(
+                    session, self._headers, base_url, list(sn_to_station)
+                )
+                single = station_ids[0] if len(station_ids) == 1 else None
+                for device in device_status:
+                    sn = device.get("deviceSn")
+                    if not sn:
+                        continue
+                    owner = device.get("stationId") or sn_to_station.get(sn) or single
+                    if owner is None:
+                        _LOGGER.warning("Cannot attribute device %s to a station", sn)
+                        continue
+                    # Index dataList once so sensor reads are dict lookups,
+                    # not linear scans per entity
+                    device["dataDict"] = {
+                        item["key"]: item for item in device.get("dataList", []) if item.get("key")
+                    }
+                    devices_by_station.setdefault(owner, {})[sn] = device
+        except Exception as exc:
+            _LOGGER.error("Error fetching device data: %s", exc)
+            if isinstance(exc, aiohttp.ClientResponseError) and exc.status == 401:
+                invalidate_cached_token(self.hass, self.entry)
+
+        # Fetch data for each station concurrently
+        station_data = {}
+        station_tasks = []
+        for station in stations:
+            station_id = station.get("id") or station.get("stationId")
+            if station_id:
+                station_tasks.append(self._async_update_station_data(
+                    session, station_id, base_url, station,
+                    devices_by_station.get(station_id, {}),
+                ))
+
+        results = await asyncio.gather(*station_tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error("Error updating station data: %s", result)
+            elif result:
+                station_id, data = result
+                station_data[station_id] = data
+
+        await _async_save_history_cache(self.hass, self.entry, self._history_cache)
 
-            # Fetch daily data for day_before, yesterday, today (HA timezone)
+        return station_data
+
+    async def _async_update_station_data(self, session, station_id, base_url, station_info, devices):
+        """Fetch data for a single station."""
+        async with _STATION_SEMAPHORE:
+            return await self._async_fetch_station_data(session, station_id, base_url, station_info, devices)
+
+    async def _async_fetch_station_data(self, session, station_id, base_url, station_info, devices):
+        data = {"info": station_info, "history": [], "history_index": {}, "daily": {}, "devices": devices}
+
+        async def _update_history():
+            # Monthly totals change slowly; between refreshes reuse the last
+            # result instead of hitting /station/history every minute
+            prev = (self.data or {}).get(station_id, {})
+            if prev.get("history") and time.monotonic() < self._history_next_refresh.get(station_id, 0):
+                data["history"] = prev["history"]
+                data["history_index"] = prev["history_index"]
+                return
+            # Closed months never change, so only fetch from the newest cached
+            # month onward (refetching that month to pick up in-progress totals)
+            cached = self._history_cache.get(str(station_id), []) if self._history_cache else []
+            start = self._history_start
+            cached_months = [(i["year"], i["month"]) for i in cached if i.get("year") and i.get("month")]
+            if cached_months:
+                last_y, last_m = max(cached_months)
+                start = date(last_y, last_m, 1)
+
+            # Re-project cached records too, so caches written before the
+            # key set changed shrink to it on the next refresh
+            merged = {
+                (i["year"], i["month"]): {k: i.get(k) for k in _HISTORY_KEYS}
+                for i in cached
+                if i.get("year") and i.get("month")
+            }
+            async for item in _async_history(session, self._headers, station_id, base_url, start):
+                if item.get("year") and item.get("month"):
+                    merged[(item["year"], item["month"])] = item
+
+            # Sorted once, with a (year, month) index so sensor reads are O(1)
+            # lookups instead of linear scans
+            history = sorted(merged.values(), key=itemgetter("year", "month"))
+            data["history"] = history
+            data["history_index"] = {(i["year"], i["month"]): i for i in history}
+            if self._history_cache is not None:
+                self._history_cache[str(station_id)] = history
+            self._history_next_refresh[station_id] = (
+                time.monotonic() + HISTORY_REFRESH_INTERVAL.total_seconds()
+            )
+
+        async def _update_daily():
+            # Fetch daily data for day_before, yesterday, today (HA timezone) concurrently
             today_date = dt_util.now().date()
             days = [today_date - timedelta(days=2), today_date - timedelta(days=1), today_date]
 
-            for d in days:
+            async def _fetch_daily(d: date):
                 start_date = d.isoformat()
                 end_date = (d + timedelta(days=1)).isoformat()
-
-                daily_data = await _async_daily_history(
-                    session, self.token, station_id, base_url, start_date, end_date
+                return start_date, await _async_daily_history(
+                    session, self._headers, station_id, base_url, start_date, end_date
                 )
 
+            for start_date, daily_data in await asyncio.gather(*map(_fetch_daily, days)):
                 if daily_data:
                     # Prefer exact matching record
                     for item in daily_data:
                         item_date = item.get("date")
                         if item_date and item_date.startswith(start_date):
                             data["daily"][start_date] = item
-                            _LOGGER.debug("Found daily data for %s: %s", start_date, item)
+                            _LOGGER.debug("Found daily data for %s", start_date)
                             break
                     else:
                         # fallback: first record
                         data["daily"][start_date] = daily_data[0]
-                        _LOGGER.debug("Using first daily record for %s: %s", start_date, daily_data[0])
+                        _LOGGER.debug("Using first daily record for %s", start_date)
 
-            # Fetch devices
-            device_sns = await _async_get_device_list(session, self.token, base_url, [station_info])
-            if device_sns:
-                device_status = await _async_get_device_status(session, self.token, base_url, device_sns)
-                for device in device_status:
-                    sn = device.get("deviceSn")
-                    if sn:
-                        data["devices"][sn] = device
+        try:
+            # History and daily data are independent; overlap them so a
+            # station update takes one round-trip latency, not two
+            await asyncio.gather(_update_history(), _update_daily())
 
         except Exception as exc:
             _LOGGER.error("Error updating data for station %s: %s", station_id, exc)
+            if isinstance(exc, aiohttp.ClientResponseError) and exc.status == 401:
+                # Make the next cycle re-authenticate instead of reusing a dead token
+                invalidate_cached_token(self.hass, self.entry)
             # Return partial data instead of failing completely
             return (station_id, data)
 
@@ -299,6 +541,23 @@ class DeyeCloudCoordinator(DataUpdateCoordinator):
 class DeyeCloudSensor(CoordinatorEntity, SensorEntity):
     """Representation of a Deye Cloud Sensor."""
 
+    # Slot storage for the attributes every native_value read touches. The
+    # HA entity base classes are slot-less so instances keep a __dict__ for
+    # anything not listed here (entity_description, the unit fallback, and
+    # whatever the base classes assign).
+    __slots__ = (
+        "_sensor_type",
+        "_station_id",
+        "_date_key",
+        "_metric_key",
+        "_device_sn",
+        "_device_key",
+        "_ym",
+        "_attr_name",
+        "_attr_unique_id",
+        "_attr_extra_state_attributes",
+    )
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -307,9 +566,8 @@ class DeyeCloudSensor(CoordinatorEntity, SensorEntity):
         sensor_type: str,
         name: str,
         unique_id: str,
+        description: SensorEntityDescription | None = None,
         unit: str | None = None,
-        device_class: str | None = None,
-        state_class: str | None = None,
         extra_attributes: dict | None = None,
         station_id: str | None = None,
         date_key: str | None = None,
@@ -322,17 +580,37 @@ class DeyeCloudSensor(CoordinatorEntity, SensorEntity):
         self._sensor_type = sensor_type
         self._attr_name = name
         self._attr_unique_id = unique_id
-        self._attr_native_unit_of_measurement = unit
-        if device_class:
-            self._attr_device_class = device_class
-        if state_class:
-            self._attr_state_class = state_class
-        self._extra_attributes = extra_attributes or {}
+        if description is not None:
+            # Shared immutable description carries unit/device_class/state_class
+            self.entity_description = description
+        else:
+            # Unrecognized device unit: expose it without classifying
+            self._attr_native_unit_of_measurement = unit
         self._station_id = station_id
         self._date_key = date_key
         self._metric_key = metric_key
         self._device_sn = device_sn
         self._device_key = device_key
+        # Parse the "year_month" key once; state reads are per refresh per entity
+        self._ym = None
+        if sensor_type == "monthly_raw" and date_key:
+            y, m = date_key.split("_")
+            self._ym = (int(y), int(m))
+
+        # Attributes don't change over the sensor's lifetime (the daily "date"
+        # is refreshed alongside native_value), so materialize the dict once
+        # instead of copying and re-assembling it on every attribute read
+        attrs = dict(extra_attributes) if extra_attributes else {}
+        if station_id:
+            attrs["station_id"] = station_id
+        if self._ym:
+            attrs["year"], attrs["month"] = self._ym
+        if sensor_type == "daily" and date_key:
+            attrs["relative_day"] = date_key
+            attrs["date"] = _resolve_daily_date_key(date_key)
+        if device_sn:
+            attrs["device_sn"] = device_sn
+        self._attr_extra_state_attributes = attrs
 
     @property
     def native_value(self):
@@ -346,38 +624,31 @@ class DeyeCloudSensor(CoordinatorEntity, SensorEntity):
 
         try:
             if self._sensor_type == "monthly_raw":
-                year, month = map(int, self._date_key.split("_"))
-                for record in station_data.get("history", []):
-                    ry = record.get("year")
-                    rm = record.get("month")
-                    if ry == year and rm == month:
-                        return record.get("generationValue")
+                record = station_data.get("history_index", {}).get(self._ym, {})
+                return record.get("generationValue")
 
             elif self._sensor_type == "monthly_metric":
-                # Current or last month metric (HA timezone)
-                if self._date_key == "current":
-                    now = dt_util.now()
-                    year, month = now.year, now.month
-                else:  # last month
-                    last_month = dt_util.now() - relativedelta(months=1)
-                    year, month = last_month.year, last_month.month
-
-                for record in station_data.get("history", []):
-                    ry = record.get("year")
-                    rm = record.get("month")
-                    if ry == year and rm == month:
-                        return record.get(self._metric_key)
+                # Current or last month metric, snapshotted per refresh cycle
+                ym = (
+                    self.coordinator.current_ym
+                    if self._date_key == "current"
+                    else self.coordinator.last_ym
+                )
+                record = station_data.get("history_index", {}).get(ym, {})
+                return record.get(self._metric_key)
 
             elif self._sensor_type == "daily":
                 date_str = _resolve_daily_date_key(self._date_key)
+                # Keep the date attribute in step as relative days roll over
+                self._attr_extra_state_attributes["date"] = date_str
                 daily_data = station_data.get("daily", {}).get(date_str, {})
                 return daily_data.get(self._metric_key)
 
             elif self._sensor_type == "device":
                 device_data = station_data.get("devices", {}).get(self._device_sn, {})
-                for data_item in device_data.get("dataList", []):
-                    if data_item.get("key") == self._device_key:
-                        return data_item.get("value")
+                data_item = device_data.get("dataDict", {}).get(self._device_key)
+                if data_item is not None:
+                    return data_item.get("value")
 
         except (KeyError, ValueError, TypeError) as exc:
             _LOGGER.error("Error extracting value for %s: %s", self.unique_id, exc)
@@ -407,27 +678,6 @@ class DeyeCloudSensor(CoordinatorEntity, SensorEntity):
             }
         
         return None
-    
-    @property
-    def extra_state_attributes(self):
-        """Return additional state attributes."""
-        attrs = self._extra_attributes.copy()
-
-        if self._station_id:
-            attrs["station_id"] = self._station_id
-
-        if self._date_key:
-            if self._sensor_type == "monthly_raw":
-                attrs["year"] = int(self._date_key.split("_")[0])
-                attrs["month"] = int(self._date_key.split("_")[1])
-            elif self._sensor_type == "daily":
-                attrs["relative_day"] = self._date_key
-                attrs["date"] = _resolve_daily_date_key(self._date_key)
-
-        if self._device_sn:
-            attrs["device_sn"] = self._device_sn
-
-        return attrs
 
 
 async def async_setup_entry(
@@ -436,38 +686,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ):
     _LOGGER.info("Setting up DeyeCloud integration")
-    global HISTORY_START_MONTH
-    HISTORY_START_MONTH = entry.data.get(CONF_START_MONTH, "2024-01")
-    _LOGGER.debug("HISTORY_START_MONTH set to: %s", HISTORY_START_MONTH)
-
     coordinator = DeyeCloudCoordinator(hass, entry)
     await coordinator.async_config_entry_first_refresh()
 
     entities = []
 
-    # HA timezone-aware now
-    now = dt_util.now()
-    this_year, this_month = now.year, now.month
-    last_month_dt = now - relativedelta(months=1)
-    prev_year, prev_month = last_month_dt.year, last_month_dt.month
-
-    _MONTHLY_METRICS = [
-        ("generationValue", "Solar Generation"),
-        ("consumptionValue", "Monthly Consumption"),
-        ("gridValue", "Monthly Grid Export"),
-        ("purchaseValue", "Monthly Grid Import"),
-        ("chargeValue", "Monthly Battery Charge"),
-        ("dischargeValue", "Monthly Battery Discharge"),
-    ]
-
-    _DAILY_METRICS = [
-        ("generationValue", "Solar Generation"),
-        ("consumptionValue", "Daily Consumption"),
-        ("gridValue", "Daily Grid Export"),
-        ("purchaseValue", "Daily Grid Import"),
-        ("chargeValue", "Daily Battery Charge"),
-        ("dischargeValue", "Daily Battery Discharge"),
-    ]
+    # Month snapshots taken by the coordinator's first refresh
+    this_year, this_month = coordinator.current_ym
+    prev_year, prev_month = coordinator.last_ym
 
     for station_id, station_data in coordinator.data.items():
         # ==== MONTHLY RAW ====
@@ -477,7 +703,11 @@ async def async_setup_entry(
             if not y or not m:
                 continue
 
-            month_name = datetime(year=y, month=m, day=1).strftime("%b %Y")
+            # Nothing to show for months where every metric is empty
+            if all(record.get(k) is None for k, _ in _MONTHLY_METRICS):
+                continue
+
+            month_name = f"{_MONTH_ABBR[m]} {y}"
             name = f"Deye {station_id} {month_name}"
             uid = f"{station_id}_raw_{y}_{m:02d}"
 
@@ -486,82 +716,61 @@ async def async_setup_entry(
                 sensor_type="monthly_raw",
                 name=name,
                 unique_id=uid,
-                unit="kWh",
-                device_class="energy",
-                state_class="total_increasing",
+                description=_ENERGY_DESCRIPTION,
                 station_id=station_id,
                 date_key=f"{y}_{m}",
-                extra_attributes=record,
             ))
 
         # ==== MONTHLY METRICS ====
-        for metric_key, metric_name in _MONTHLY_METRICS:
-            # Current month
-            name = f"{metric_name} {station_id}"
-            uid = f"{station_id}_{metric_key}_current_month"
-            entities.append(DeyeCloudSensor(
+        def _make_metric_sensor(metric_key, metric_name, name, uid_suffix, date_key, year, month):
+            return DeyeCloudSensor(
                 coordinator=coordinator,
                 sensor_type="monthly_metric",
                 name=name,
-                unique_id=uid,
-                unit="kWh",
-                device_class="energy",
-                state_class="total_increasing",
+                unique_id=f"{station_id}_{metric_key}_{uid_suffix}",
+                description=_ENERGY_DESCRIPTION,
                 station_id=station_id,
-                date_key="current",
+                date_key=date_key,
                 metric_key=metric_key,
                 extra_attributes={
-                    "year": this_year,
-                    "month": this_month,
+                    "year": year,
+                    "month": month,
                     "metric": metric_name,
                 }
-            ))
+            )
+
+        entities.extend(
+            _make_metric_sensor(
+                metric_key, metric_name, f"{metric_name} {station_id}",
+                "current_month", "current", this_year, this_month,
+            )
+            for metric_key, metric_name in _MONTHLY_METRICS
+        )
+        entities.extend(
+            _make_metric_sensor(
+                metric_key, metric_name, f"{metric_name} (Tháng trước) {station_id}",
+                "last_month", "last", prev_year, prev_month,
+            )
+            for metric_key, metric_name in _MONTHLY_METRICS
+        )
 
-            # Last month
-            name = f"{metric_name} (Tháng trước) {station_id}"
-            uid = f"{station_id}_{metric_key}_last_month"
-            entities.append(DeyeCloudSensor(
+        # ==== DAILY ====
+        # Relative keys (today/yesterday/...) so sensors auto-update when day changes
+        entities.extend(
+            DeyeCloudSensor(
                 coordinator=coordinator,
-                sensor_type="monthly_metric",
-                name=name,
-                unique_id=uid,
-                unit="kWh",
-                device_class="energy",
-                state_class="total_increasing",
+                sensor_type="daily",
+                name=f"{metric_name} {rel_label} {station_id}",
+                unique_id=f"{station_id}_{metric_key}{rel_suffix}",
+                description=_ENERGY_DESCRIPTION,
                 station_id=station_id,
-                date_key="last",
+                date_key=rel_key,
                 metric_key=metric_key,
-                extra_attributes={
-                    "year": prev_year,
-                    "month": prev_month,
-                    "metric": metric_name,
-                }
-            ))
-
-        # ==== DAILY ====
-        # Create sensors using relative keys so they auto-update when day changes
-        for rel_key, rel_suffix in [
-            ("day_before", "_day_before"),
-            ("yesterday", "_yesterday"),
-            ("today", "_today"),
-        ]:
-            for metric_key, metric_name in _DAILY_METRICS:
-                name = f"{metric_name} {rel_suffix.replace('_', ' ')} {station_id}"
-                uid = f"{station_id}_{metric_key}{rel_suffix}"
-
-                entities.append(DeyeCloudSensor(
-                    coordinator=coordinator,
-                    sensor_type="daily",
-                    name=name,
-                    unique_id=uid,
-                    unit="kWh",
-                    device_class="energy",
-                    state_class="total_increasing",
-                    station_id=station_id,
-                    date_key=rel_key,  # relative key
-                    metric_key=metric_key,
-                    extra_attributes={"relative_day": rel_key},
-                ))
+                extra_attributes={"relative_day": rel_key},
+            )
+            for rel_key, rel_suffix, rel_label in _RELATIVE_DAY_SENSORS
+            for metric_key, metric_name in _DAILY_METRICS
+        )
 
         # ==== DEVICE STATUS ====
         for device_sn, device_data in station_data.get("devices", {}).items():
@@ -572,40 +781,15 @@ async def async_setup_entry(
                 name = f"{key} {device_sn}"
                 uid = f"device_{device_sn}_{key}"
 
-                # Check unit
+                # Known units map to a shared description; others pass through
                 unit = data_item.get("unit", "")
-                unit_device_class = None
-                unit_state_class = None
-                if unit == "kWh":
-                    unit_device_class = "energy"
-                    unit_state_class = "total_increasing"
-                elif unit == "W":
-                    unit_device_class = "power"
-                    unit_state_class = "measurement"
-                elif unit == "V":
-                    unit_device_class = "voltage"
-                    unit_state_class = "measurement"
-                elif unit == "A":
-                    unit_device_class = "current"
-                    unit_state_class = "measurement"
-                elif unit == "%":
-                    unit_device_class = "battery"
-                    unit_state_class = "measurement"
-                elif unit in ["C", "°C"]:
-                    unit_device_class = "temperature"
-                    unit_state_class = "measurement"
-                elif unit == "Hz":
-                    unit_device_class = "frequency"
-                    unit_state_class = "measurement"
-
                 entities.append(DeyeCloudSensor(
                     coordinator=coordinator,
                     sensor_type="device",
                     name=name,
                     unique_id=uid,
-                    unit=data_item.get("unit", ""),
-                    device_class=unit_device_class,
-                    state_class=unit_state_class,
+                    description=_UNIT_DESCRIPTIONS.get(unit),
+                    unit=unit,
                     station_id=station_id,
                     device_sn=device_sn,
                     device_key=key,